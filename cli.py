@@ -0,0 +1,136 @@
+"""
+Command-line entry point: `python cli.py {load,mask,build-dataset,report} ...`.
+
+Modules depending on pandas, matplotlib or statistical packages are imported inside commands, so `--help` and
+light commands do not pay their import time.
+"""
+import argparse
+import os
+import sys
+
+STRATEGIES = ['even', 'initiative', 'absence']
+REPORT_KINDS = ['simple', 'horizontal', 'domain', 'heatmap']
+
+
+def load(args: argparse.Namespace):
+    """
+    Fetches tempo worklogs updated since stored watermark and merges them into csv file.
+    """
+    from utils.tempo_client import TempoClient
+
+    client = TempoClient(args.url, args.token, pool_size=args.pool_size, page_limit=args.page_limit,
+                         watermark_path=args.watermark)
+    data = client.fetch()
+    client.update_csv(args.output)
+    print(f'{len(data)} worklogs fetched into {args.output}')
+
+
+def mask(args: argparse.Namespace):
+    """
+    Saves masked data with masks/unmasks into output folder.
+    """
+    from utils.combined import load_data_and_save_masked
+
+    os.makedirs(args.output_folder, exist_ok=True)
+    load_data_and_save_masked(args.data, args.output_folder)
+
+
+def build_dataset(args: argparse.Namespace):
+    """
+    Creates dataset with features in given periods and saves it as csv file or parquet partitions.
+    """
+    from models.dataset import create_dataset
+    from utils.data_builder import DataBuilder
+    from utils.data_loader import DataLoader
+    from utils.dataset_writer import DatasetWriter
+
+    db = DataBuilder(DataLoader(args.data).get_data())
+    periods = [tuple(period) for period in args.period]
+    writer = DatasetWriter(args.partitioned_output) if args.partitioned_output is not None else None
+    dataset = create_dataset(db, periods, args.ignore_weekends, args.n_periods, args.strategy, args.single_metrics,
+                             writer)
+    if args.output is not None:
+        if writer is not None:
+            dataset = writer.read(periods=periods)
+        dataset.to_csv(args.output)
+
+
+def report(args: argparse.Namespace):
+    """
+    Saves visualization of physical worklog of author (`simple`, `horizontal`) or domain (`domain`, `heatmap`).
+    """
+    from reports import time_series
+    from utils.data_loader import DataLoader
+    from utils.worklog_cube import WorklogCube
+
+    cube = WorklogCube(DataLoader(args.data).get_data())
+    if args.kind == 'simple':
+        time_series.simple_tempo_worklog_report(cube, args.name, args.date_from, args.date_until,
+                                                args.ignore_weekends)
+    elif args.kind == 'horizontal':
+        time_series.horizontal_tempo_worklog_report(cube, args.name, args.date_from, args.date_until,
+                                                    args.ignore_weekends)
+    else:
+        report_function = (time_series.domain_tempo_worklog_report if args.kind == 'domain' else
+                           time_series.team_heatmap_report)
+        try:
+            report_function(cube, args.name, args.date_from, args.date_until, args.freq)
+        except ValueError as error:
+            sys.exit(f'report: {error}')
+
+
+def create_parser():
+    parser = argparse.ArgumentParser(description='Tempo worklog based employee productivity research tools.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    load_parser = subparsers.add_parser('load', help='fetch worklogs from tempo REST endpoint into csv file')
+    load_parser.add_argument('url', help='base url of tempo API (e.g. https://api.tempo.io/4)')
+    load_parser.add_argument('output', help='path to csv file to merge worklogs into')
+    load_parser.add_argument('--token', default=os.environ.get('TEMPO_TOKEN'),
+                             help='API token (default: TEMPO_TOKEN environment variable)')
+    load_parser.add_argument('--watermark', help='path to json file with latest fetched `updated` value')
+    load_parser.add_argument('--pool-size', type=int, default=4, help='number of concurrent connections')
+    load_parser.add_argument('--page-limit', type=int, default=1000, help='number of worklogs per page')
+    load_parser.set_defaults(handler=load)
+
+    mask_parser = subparsers.add_parser('mask', help='mask data and save it with masks/unmasks')
+    mask_parser.add_argument('data', help='path to input data csv file')
+    mask_parser.add_argument('output_folder', help='path to output folder')
+    mask_parser.set_defaults(handler=mask)
+
+    dataset_parser = subparsers.add_parser('build-dataset', help='create dataset with features')
+    dataset_parser.add_argument('data', help='path to input data csv file')
+    dataset_parser.add_argument('--period', nargs=2, action='append', required=True,
+                                metavar=('DATE_FROM', 'DATE_UNTIL'), help='period of time (can be repeated)')
+    dataset_parser.add_argument('--output', help='path to output csv file')
+    dataset_parser.add_argument('--partitioned-output',
+                                help='path to output folder with checkpointed parquet partitions')
+    dataset_parser.add_argument('--ignore-weekends', action='store_true')
+    dataset_parser.add_argument('--n-periods', type=int, default=3)
+    dataset_parser.add_argument('--strategy', choices=STRATEGIES, default='even')
+    dataset_parser.add_argument('--single-metrics', action='store_true', help='add single target metrics')
+    dataset_parser.set_defaults(handler=build_dataset)
+
+    report_parser = subparsers.add_parser('report', help='save visualization of physical worklog')
+    report_parser.add_argument('data', help='path to input data csv file')
+    report_parser.add_argument('name', help='author for `simple` and `horizontal` reports, domain for others')
+    report_parser.add_argument('date_from')
+    report_parser.add_argument('date_until')
+    report_parser.add_argument('--kind', choices=REPORT_KINDS, default='simple')
+    report_parser.add_argument('--freq', choices=['D', 'W', 'M', 'Q'], default='W',
+                               help='time period of `domain` and `heatmap` reports')
+    report_parser.add_argument('--ignore-weekends', action='store_true')
+    report_parser.set_defaults(handler=report)
+
+    return parser
+
+
+def main(argv: list[str] = None):
+    args = create_parser().parse_args(argv)
+    if args.command == 'build-dataset' and args.output is None and args.partitioned_output is None:
+        sys.exit('build-dataset: either --output or --partitioned-output is required')
+    args.handler(args)
+
+
+if __name__ == '__main__':
+    main()
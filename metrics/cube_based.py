@@ -0,0 +1,84 @@
+from metrics.tempo_based import SUPPORT_ISSUE_TYPES, WEIGHTED_METRIC_STRATEGIES
+from metrics.tempo_based import round_outliers, get_supposed_work_hours_by_period
+from utils.worklog_cube import WorklogCube
+
+# Same metrics as in `metrics.tempo_based`, answered from pre-aggregated `WorklogCube` instead of raw worklog rows.
+
+
+def compute_initiative_completion_rate(cube: WorklogCube, author: str, date_from: str, date_until: str):
+    """
+    Compute initiative completion rate metric.
+    :param cube: WorklogCube class object.
+    :param author: login of worker who logged time.
+    :param date_from: start date in period.
+    :param date_until: end date in period.
+    :return: value of metric.
+    """
+    issues = cube.select_issues(None, author, date_from, date_until)
+    max_hours_initiative = issues.groupby('issuekey', observed=True).hour.sum().max()
+    return round_outliers(1 - max_hours_initiative / get_supposed_work_hours_by_period(date_from, date_until))
+
+
+def compute_support_tasks_rate(cube: WorklogCube, author: str, date_from: str, date_until: str):
+    """
+    Compute support tasks rate metric.
+    :param cube: WorklogCube class object.
+    :param author: login of worker who logged time.
+    :param date_from: start date in period.
+    :param date_until: end date in period.
+    :return: value of metric.
+    """
+    cells = cube.select(None, author, date_from, date_until)
+    hours_support_issues = cells.loc[cells.issue_type.isin(SUPPORT_ISSUE_TYPES)].hour.sum()
+    return round_outliers(1 - hours_support_issues / get_supposed_work_hours_by_period(date_from, date_until))
+
+
+def compute_absent_rate(cube: WorklogCube, author: str, date_from: str, date_until: str):
+    """
+    Compute absent rate metric.
+    :param cube: WorklogCube class object.
+    :param author: login of worker who logged time.
+    :param date_from: start date in period.
+    :param date_until: end date in period.
+    :return: value of metric.
+    """
+    cells = cube.select(None, author, date_from, date_until)
+    absence_hours = cells.loc[cells.absence].hour.sum()
+    return round_outliers(1 - absence_hours / get_supposed_work_hours_by_period(date_from, date_until))
+
+
+def compute_initiative_share_by_domain(cube: WorklogCube, author: str, domain: str, date_from: str,
+                                       date_until: str):
+    """
+    Compute initiative share by domain metric: issues of `author` (in any domain) to issues of `domain`.
+    :param cube: WorklogCube class object.
+    :param author: login of worker who logged time.
+    :param domain: certain team of workers.
+    :param date_from: start date in period.
+    :param date_until: end date in period.
+    :return: value of metric.
+    """
+    return round_outliers(cube.get_distinct_issues(None, date_from, date_until, author) /
+                          cube.get_distinct_issues(domain, date_from, date_until))
+
+
+def compute_weighted_target(cube: WorklogCube, author: str, domain: str, date_from: str, date_until: str,
+                            strategy: str = 'even'):
+    """
+    Compute weighted metric with given `strategy`.
+    :param cube: WorklogCube class object.
+    :param author: login of worker who logged time.
+    :param domain: certain team of workers.
+    :param date_from: start date in period.
+    :param date_until: end date in period.
+    :param strategy: `even`, `initiative` or `absence`.
+    :return: value of weighted metric.
+    """
+    icr = compute_initiative_completion_rate(cube, author, date_from, date_until)
+    suptr = compute_support_tasks_rate(cube, author, date_from, date_until)
+    ar = compute_absent_rate(cube, author, date_from, date_until)
+    isd = compute_initiative_share_by_domain(cube, author, domain, date_from, date_until)
+
+    weights = WEIGHTED_METRIC_STRATEGIES[strategy]
+
+    return icr * weights['icr'] + suptr * weights['suptr'] + ar * weights['ar'] + isd * weights['isd']
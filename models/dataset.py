@@ -1,10 +1,13 @@
-from features import *
-from metrics.tempo_based import *
+from models.features import *
+from metrics import cube_based
 from utils.data_builder import DataBuilder
+from utils.dataset_writer import DatasetWriter
+from utils.worklog_cube import WorklogCube
 
 
 def create_dataset_in_period(db: DataBuilder, date_from: str, date_until: str, ignore_weekends: bool = False,
-                             n_periods: int = 3, strategy: str = 'even', add_single_metrics: bool = False):
+                             n_periods: int = 3, strategy: str = 'even', add_single_metrics: bool = False,
+                             writer: DatasetWriter = None, cube: WorklogCube = None):
     """
     Create dataset with features for all `domains` for all `authors` in specific period of time.
     :param db: DataBuilder class object.
@@ -14,69 +17,103 @@ def create_dataset_in_period(db: DataBuilder, date_from: str, date_until: str, i
     :param n_periods: number of periods for "least k periods" computation.
     :param strategy: `even`, `initiative` or `absence`.
     :param add_single_metrics: whether to add single target metrics to dataset or just the value of weighted metric.
-    :return: pd.DataFrame dataset.
+    :param writer: if set, each domain is saved as a partition once proceeded and domains completed earlier are
+    skipped; the dataset is not kept in memory then. Raises ValueError if `writer` holds partitions created with
+    other parameters.
+    :param cube: WorklogCube built from `db` data (built if `None`), time series and metrics are computed from it.
+    :return: pd.DataFrame dataset (`None` if `writer` is set, read it with `writer.read`).
     """
-    domains = db.data['domain'].unique()
-    domains_data = [db.get_domain_worklog_in_period(domain, date_from, date_until) for domain in domains]
-
-    result = dict()
-    index = []
-
-    for domain_data in domains_data:
-        for author in domain_data['author'].unique():
-            index.append(f'{author}_{date_from}_{date_until}')
-
-            # features
-            author_time_series = db.create_series_logged_time(author, date_from, date_until, ignore_weekends)
-            periods = dict(zip(
-                ['period' + str(i + 1) for i in range(n_periods)],
-                get_k_periods(author_time_series, n_periods)
-            ))
-            stationary_tests = get_stationary_tests_results(author_time_series, ['adf', 'pp', 'kpss'],
-                                                            ['c', 'ct', 'ctt'])
-            maximum, p_value = get_fstats_in_peak(author_time_series)
-            structural_shift = {'max': maximum, 'shift': p_value}
-            mean, var = get_mean_var(author_time_series)
-            static_features = {'mean': mean, 'var': var}
-            week_daily_means = get_week_daily_means(author_time_series, ignore_weekends)
-            co_integration = get_co_integration(author_time_series, ['daily', 'weekly'], ignore_weekends)
-
-            # target
-            author_worklog = db.get_employee_worklog_in_period(author, date_from, date_until)
-
-            target = {
-                'target': compute_weighted_target(author_worklog, domain_data, date_from, date_until, strategy)
-            }
-
-            if add_single_metrics:
-                single_metrics = {
-                    'icr': compute_initiative_completion_rate(author_worklog, date_from, date_until),
-                    'suptr': compute_support_tasks_rate(author_worklog, date_from, date_until),
-                    'ar': compute_absent_rate(author_worklog, date_from, date_until),
-                    'isd': compute_initiative_share_by_domain(author_worklog, domain_data),
-                }
-                target = single_metrics | target
-
-            full_features = (periods | stationary_tests | structural_shift | static_features | week_daily_means |
-                             co_integration | target)
-
-            if not result:
-                for key, value in full_features.items():
-                    result[key] = [value]
-            else:
-                for key, value in full_features.items():
-                    result[key].append(value)
-
-        if not domain_data.empty:
-            print(f'{domain_data["domain"].unique()[0]} proceeded for dates {date_from} - {date_until}')
-
-    result['author'] = index
-
-    return pd.DataFrame.from_dict(result).set_index('author')
+    if cube is None:
+        cube = WorklogCube(db.data)
+    if writer is not None:
+        writer.set_parameters({'ignore_weekends': ignore_weekends, 'n_periods': n_periods, 'strategy': strategy,
+                               'add_single_metrics': add_single_metrics})
+
+    datasets = []
+
+    # worklogs without domain count only in their authors' metrics
+    for domain in cube.get_domains():
+        if writer is not None and writer.is_completed(date_from, date_until, domain):
+            continue
+
+        authors = cube.get_authors(domain, date_from, date_until)
+
+        rows = [create_author_features(cube, author, domain, date_from, date_until, ignore_weekends, n_periods,
+                                       strategy, add_single_metrics)
+                for author in authors]
+        dataset = pd.DataFrame(rows)
+        if not dataset.empty:
+            dataset = dataset.set_index('author')
+
+        if writer is not None:
+            writer.write(dataset, date_from, date_until, domain)
+        elif not dataset.empty:
+            datasets.append(dataset)
+
+        if authors:
+            print(f'{domain} proceeded for dates {date_from} - {date_until}')
+
+    if writer is not None:
+        return None
+
+    if not datasets:
+        return pd.DataFrame()
+
+    return pd.concat(datasets)
+
+
+def create_author_features(cube: WorklogCube, author: str, domain: str, date_from: str, date_until: str,
+                           ignore_weekends: bool = False, n_periods: int = 3, strategy: str = 'even',
+                           add_single_metrics: bool = False):
+    """
+    Create features and target of single `author` in specific period of time.
+    :param cube: WorklogCube class object.
+    :param author: login of worker who logged time.
+    :param domain: `author`'s team of workers.
+    :param date_from: start date in period.
+    :param date_until: end date in period.
+    :param ignore_weekends: whether to ignore logged time during weekends or not.
+    :param n_periods: number of periods for "least k periods" computation.
+    :param strategy: `even`, `initiative` or `absence`.
+    :param add_single_metrics: whether to add single target metrics to dataset or just the value of weighted metric.
+    :return: dict with `author` index value, features and target.
+    """
+    # features
+    author_time_series = cube.create_series_logged_time(author, date_from, date_until, ignore_weekends)
+    periods = dict(zip(
+        ['period' + str(i + 1) for i in range(n_periods)],
+        get_k_periods(author_time_series, n_periods)
+    ))
+    stationary_tests = get_stationary_tests_results(author_time_series, ['adf', 'pp', 'kpss'],
+                                                    ['c', 'ct', 'ctt'])
+    maximum, p_value = get_fstats_in_peak(author_time_series)
+    structural_shift = {'max': maximum, 'shift': p_value}
+    mean, var = get_mean_var(author_time_series)
+    static_features = {'mean': mean, 'var': var}
+    week_daily_means = get_week_daily_means(author_time_series, ignore_weekends)
+    co_integration = get_co_integration(author_time_series, ['daily', 'weekly'], ignore_weekends)
+
+    # target
+    target = {
+        'target': cube_based.compute_weighted_target(cube, author, domain, date_from, date_until, strategy)
+    }
+
+    if add_single_metrics:
+        single_metrics = {
+            'icr': cube_based.compute_initiative_completion_rate(cube, author, date_from, date_until),
+            'suptr': cube_based.compute_support_tasks_rate(cube, author, date_from, date_until),
+            'ar': cube_based.compute_absent_rate(cube, author, date_from, date_until),
+            'isd': cube_based.compute_initiative_share_by_domain(cube, author, domain, date_from, date_until),
+        }
+        target = single_metrics | target
+
+    return ({'author': f'{author}_{date_from}_{date_until}'} | periods | stationary_tests | structural_shift |
+            static_features | week_daily_means | co_integration | target)
 
 
 def create_dataset(db: DataBuilder, dates: list[tuple[str, str]], ignore_weekends: bool = False,
-                   n_periods: int = 3, strategy: str = 'even', add_single_metrics: bool = False):
+                   n_periods: int = 3, strategy: str = 'even', add_single_metrics: bool = False,
+                   writer: DatasetWriter = None):
     """
     Wrap over `create_dataset_in_period`, allows to create dataset with multiple periods of time.
     :param db: DataBuilder class object.
@@ -85,15 +122,18 @@ def create_dataset(db: DataBuilder, dates: list[tuple[str, str]], ignore_weekend
     :param n_periods: number of periods for "least k periods" computation.
     :param strategy: `even` for equal weight of target metrics, `initiative` for initiative focus, `absence` for absence focus.
     :param add_single_metrics: whether to add single target metrics to dataset or just the value of weighted metric.
-    :return: pd.DataFrame dataset.
+    :param writer: if set, each period is saved partitioned by domain and resumed from checkpoint.
+    :return: pd.DataFrame dataset (`None` if `writer` is set, read it with `writer.read`).
     """
-    result = None
-    for date_from, date_until in dates:
-        dataset = create_dataset_in_period(db, date_from, date_until, ignore_weekends, n_periods, strategy,
-                                           add_single_metrics)
-        if result is None:
-            result = dataset
-        else:
-            result = pd.concat([result, dataset])
-
-    return result
+    cube = WorklogCube(db.data)
+    datasets = [create_dataset_in_period(db, date_from, date_until, ignore_weekends, n_periods, strategy,
+                                         add_single_metrics, writer, cube)
+                for date_from, date_until in dates]
+
+    if writer is not None:
+        return None
+
+    if not datasets:
+        return pd.DataFrame()
+
+    return pd.concat(datasets)
@@ -3,20 +3,11 @@ from datetime import date
 import numpy as np
 import pandas as pd
 
-from scipy.signal import periodogram, welch
-import scipy.stats as stats
-
-from arch.unitroot import PhillipsPerron
-from arch.utility.exceptions import InfeasibleTestException
-from statsmodels.tools.sm_exceptions import InterpolationWarning
-
-from statsmodels.tsa.stattools import adfuller, kpss
-from statsmodels.tsa.vector_ar.vecm import coint_johansen
-
 import warnings
-warnings.filterwarnings("ignore", category=InterpolationWarning)
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
+# scipy, statsmodels and arch take seconds to import, so they are imported on first use inside functions
+
 
 DEFAULT_CO_INTEGRATION_RESULT = {
     'daily0': 1,
@@ -49,6 +40,8 @@ def get_k_periods(data: pd.Series, k: int, method: str = 'periodogram'):
     :param method: either `periodogram` or `welch` (different methods to estimate power spectral density).
     :return: list of k lags that are considered as values of periods.
     """
+    from scipy.signal import periodogram, welch
+
     if method == 'periodogram':
         _, y = periodogram(data.values)
     else:
@@ -68,6 +61,13 @@ def get_stationary_tests_results(data: pd.Series, methods: list[str] = None, reg
     :param significance_level: level of significance to reject null hypothesis.
     :return: dictionary with keys `<method>_<regressor>` and values as results of corresponding tests.
     """
+    from arch.unitroot import PhillipsPerron
+    from arch.utility.exceptions import InfeasibleTestException
+    from statsmodels.tools.sm_exceptions import InterpolationWarning
+    from statsmodels.tsa.stattools import adfuller, kpss
+
+    warnings.filterwarnings("ignore", category=InterpolationWarning)
+
     if methods is None:
         methods = ['adf']
     if regression is None:
@@ -114,6 +114,8 @@ def get_fstats_in_peak(data: pd.Series, peak: date = None, significance_level: f
     :param significance_level: level of significance to reject null hypothesis.
     :return: value of `data` in `peak` and either True if there is no structural break in `data` in `peak` or False.
     """
+    import scipy.stats as stats
+
     if peak is None:
         peak = data.idxmax()
 
@@ -173,6 +175,8 @@ def get_co_integration(data: pd.Series, patterns: list[str] = None, ignore_weeke
     :param ignore_weekends: whether to ignore logged time during weekends or not.
     :return: dict with following keys: `<pattern>0` indicates if there is no co-integration relation, `<pattern>1` if there is one, `<pattern>2` if there is more than one.
     """
+    from statsmodels.tsa.vector_ar.vecm import coint_johansen
+
     if patterns is None:
         patterns = ['daily']
 
@@ -1,12 +1,15 @@
+from typing import Union
+
 from utils.data_builder import DataBuilder
+from utils.worklog_cube import WorklogCube
 import matplotlib.pyplot as plt
 
 
-def simple_tempo_worklog_report(db: DataBuilder, author: str, date_from: str, date_until: str,
+def simple_tempo_worklog_report(db: Union[DataBuilder, WorklogCube], author: str, date_from: str, date_until: str,
                                 ignore_weekends: bool = False):
     """
     Visualization of physical `author`'s worklog.
-    :param db: DataBuilder class object.
+    :param db: DataBuilder or WorklogCube class object.
     :param author: login of worker who logged time.
     :param date_from: start date in period.
     :param date_until: end date in period.
@@ -19,11 +22,11 @@ def simple_tempo_worklog_report(db: DataBuilder, author: str, date_from: str, da
     fig.savefig(f"simple_tempo_worklog_{author}.png")
 
 
-def horizontal_tempo_worklog_report(db: DataBuilder, author: str, date_from: str, date_until: str,
+def horizontal_tempo_worklog_report(db: Union[DataBuilder, WorklogCube], author: str, date_from: str, date_until: str,
                                     ignore_weekends: bool = False):
     """
     Visualization of physical `author`'s worklog with horizontal bars.
-    :param db: DataBuilder class object.
+    :param db: DataBuilder or WorklogCube class object.
     :param author: login of worker who logged time.
     :param date_from: start date in period.
     :param date_until: end date in period.
@@ -34,3 +37,45 @@ def horizontal_tempo_worklog_report(db: DataBuilder, author: str, date_from: str
     plot.xaxis.grid(True, which='major')
     fig = plot.get_figure()
     fig.savefig(f"horizontal_tempo_worklog_{author}.png")
+
+
+def domain_tempo_worklog_report(cube: WorklogCube, domain: str, date_from: str, date_until: str, freq: str = 'W'):
+    """
+    Visualization of physical `domain` worklog with stacked bars of its authors.
+    :param cube: WorklogCube class object.
+    :param domain: certain team of workers.
+    :param date_from: start date in period.
+    :param date_until: end date in period.
+    :param freq: `D` (day), `W` (week), `M` (month) or `Q` (quarter).
+    :raise ValueError: if `domain` has no worklogs in period.
+    """
+    matrix = cube.get_team_matrix(domain, date_from, date_until, freq)
+    if matrix.empty:
+        raise ValueError(f'No worklogs of domain {domain} from {date_from} until {date_until}')
+    plot = matrix.T.plot(kind='bar', stacked=True, title="Worklog tempo of " + domain, ylabel='Hours')
+    plot.yaxis.grid(True, which='major')
+    fig = plot.get_figure()
+    fig.savefig(f"domain_tempo_worklog_{domain}.png")
+
+
+def team_heatmap_report(cube: WorklogCube, domain: str, date_from: str, date_until: str, freq: str = 'D'):
+    """
+    Heatmap of hours physically logged by `domain` authors in each time period.
+    :param cube: WorklogCube class object.
+    :param domain: certain team of workers.
+    :param date_from: start date in period.
+    :param date_until: end date in period.
+    :param freq: `D` (day), `W` (week), `M` (month) or `Q` (quarter).
+    :raise ValueError: if `domain` has no worklogs in period.
+    """
+    matrix = cube.get_team_matrix(domain, date_from, date_until, freq)
+    if matrix.empty:
+        raise ValueError(f'No worklogs of domain {domain} from {date_from} until {date_until}')
+    fig, ax = plt.subplots(figsize=(max(8, len(matrix.columns) // 3), max(4, len(matrix.index) // 3)))
+    image = ax.imshow(matrix.values, aspect='auto', cmap='YlGn')
+    ax.set_title("Team worklog heatmap of " + domain)
+    ax.set_xticks(range(len(matrix.columns)), [str(period) for period in matrix.columns], rotation=90)
+    ax.set_yticks(range(len(matrix.index)), matrix.index)
+    fig.colorbar(image, ax=ax, label='Hours')
+    fig.tight_layout()
+    fig.savefig(f"team_heatmap_{domain}.png")
@@ -0,0 +1,92 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class TempoStubServer:
+    """
+    Local stub of paginated tempo worklogs endpoint (`/4/worklogs`) for tests.
+
+    Serves given worklogs sorted by `updatedAt`, supports `offset`, `limit` and `updatedFrom` query parameters.
+    First `n_failures` requests are answered with 503 status. `on_request` is called with stub and query parameters
+    before each page is served (e.g. to update worklogs while they are fetched).
+    """
+    def __init__(self, worklogs: list[dict], n_failures: int = 0, on_request=None):
+        self.worklogs = worklogs
+        self.n_failures = n_failures
+        self.on_request = on_request
+        self.requests = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.__make_handler())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                params = {key: values[0] for key, values in parse_qs(url.query).items()}
+                with stub.lock:
+                    stub.requests.append(params)
+                    is_failure = stub.n_failures > 0
+                    stub.n_failures -= 1
+
+                if url.path != '/4/worklogs':
+                    return self.__respond(404, {})
+                if is_failure:
+                    return self.__respond(503, {})
+                if stub.on_request is not None:
+                    stub.on_request(stub, params)
+
+                offset = int(params.get('offset', 0))
+                limit = int(params.get('limit', 50))
+                worklogs = sorted(stub.worklogs, key=lambda worklog: worklog['updatedAt'])
+                if 'updatedFrom' in params:
+                    worklogs = [worklog for worklog in worklogs if worklog['updatedAt'] >= params['updatedFrom']]
+                page = worklogs[offset: offset + limit]
+
+                self.__respond(200, {'metadata': {'count': len(page), 'offset': offset, 'limit': limit},
+                                     'results': page})
+
+            def __respond(self, status: int, payload: dict):
+                body = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def get_base_url(self):
+        host, port = self.server.server_address
+        return f'http://{host}:{port}/4'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def make_worklog(worklog_id: int, author: str, updated_at: str, seconds: int = 3600, issuekey: str = 'issuekey0',
+                 issue_type: str = 'Task', issue_summary: str = 'Working on issue', team: str = 'domain0'):
+    return {
+        'tempoWorklogId': worklog_id,
+        'issue': {'key': issuekey, 'type': issue_type, 'summary': issue_summary},
+        'startDate': updated_at[:10],
+        'timeSpentSeconds': seconds,
+        'author': {'accountId': author},
+        'description': 'Working on issue',
+        'updatedAt': updated_at,
+        'team': {'name': team},
+    }
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_PATH = os.path.join(ROOT, 'data_sample', 'tempo_db_masked_sample.csv')
+HEAVY_MODULES = ['pandas', 'matplotlib', 'scipy', 'statsmodels', 'arch']
+STATISTICAL_MODULES = ['scipy', 'statsmodels', 'arch']
+HELP_TIME_BUDGET = 1.0
+
+
+def run_python(*args: str):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def get_loaded_modules(module: str, candidates: list[str]):
+    code = f'import sys, {module}; print(",".join(x for x in {candidates} if x in sys.modules))'
+    return run_python('-c', code).stdout.strip()
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_import_loads_no_heavy_modules(self):
+        self.assertEqual(get_loaded_modules('cli', HEAVY_MODULES), '')
+
+    def test_dataset_import_loads_no_statistical_modules(self):
+        self.assertEqual(get_loaded_modules('models.dataset', STATISTICAL_MODULES), '')
+
+    def test_help_time_budget(self):
+        start = time.perf_counter()
+        run_python('cli.py', '--help')
+        self.assertLess(time.perf_counter() - start, HELP_TIME_BUDGET)
+
+    def test_mask(self):
+        run_python('cli.py', 'mask', DATA_PATH, self.folder.name)
+        self.assertEqual(sorted(os.listdir(self.folder.name)), ['data_masked.csv', 'masks.json', 'unmasks.json'])
+
+    def test_build_dataset(self):
+        output = os.path.join(self.folder.name, 'dataset.csv')
+        run_python('cli.py', 'build-dataset', DATA_PATH, '--period', '2024-10-01', '2024-10-14',
+                   '--ignore-weekends', '--single-metrics', '--output', output)
+
+        dataset = pd.read_csv(output, index_col=0)
+        self.assertEqual(list(dataset.index), ['author0_2024-10-01_2024-10-14', 'author1_2024-10-01_2024-10-14'])
+        self.assertEqual(dataset.loc['author0_2024-10-01_2024-10-14', 'mean'], 8.0)
+        self.assertEqual(dataset.loc['author0_2024-10-01_2024-10-14', 'isd'], 1.0)
+
+    def test_build_partitioned_dataset(self):
+        output = os.path.join(self.folder.name, 'dataset.csv')
+        partitioned_output = os.path.join(self.folder.name, 'dataset')
+        run_python('cli.py', 'build-dataset', DATA_PATH, '--period', '2024-10-01', '2024-10-14',
+                   '--ignore-weekends', '--partitioned-output', partitioned_output, '--output', output)
+
+        dataset = pd.read_csv(output, index_col=0)
+        self.assertEqual(list(dataset.index), ['author0_2024-10-01_2024-10-14', 'author1_2024-10-01_2024-10-14'])
+        self.assertIn('period=2024-10-01_2024-10-14', os.listdir(partitioned_output))
+
+    def test_report_of_unknown_domain(self):
+        result = subprocess.run([sys.executable, 'cli.py', 'report', DATA_PATH, 'domain9', '2024-10-01', '2024-10-14',
+                                 '--kind', 'heatmap'], cwd=ROOT, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(result.stderr, 'report: No worklogs of domain domain9 from 2024-10-01 until 2024-10-14\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+
+import pandas as pd
+
+from models.dataset import create_dataset
+from utils.data_builder import DataBuilder
+from utils.data_loader import DataLoader
+from utils.dataset_writer import DatasetWriter
+
+
+class TestDataset(unittest.TestCase):
+    def setUp(self):
+        dl = DataLoader('../data_sample/tempo_db_masked_sample.csv')
+        # domain names out of alphabetical order of their appearance
+        self.db = DataBuilder(dl.get_data().replace({'domain': {'domain0': 'zeta', 'domain1': 'alpha'}}))
+        self.dates = [('2024-10-01', '2024-10-14')]
+        self.folder = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_writer_returns_same_dataset(self):
+        expected = create_dataset(self.db, self.dates, True, 3, 'even', True)
+        writer = DatasetWriter(self.folder.name)
+        self.assertIsNone(create_dataset(self.db, self.dates, True, 3, 'even', True, writer))
+        values = writer.read()
+        pd.testing.assert_frame_equal(values, expected)
+        self.assertIn(0, values.columns)
+
+        writer = DatasetWriter(self.folder.name)
+        create_dataset(self.db, self.dates, True, 3, 'even', True, writer)
+        pd.testing.assert_frame_equal(writer.read(), expected)
+
+    def test_writer_refuses_other_parameters(self):
+        create_dataset(self.db, self.dates, True, 3, 'even', True, DatasetWriter(self.folder.name))
+        with self.assertRaises(ValueError):
+            create_dataset(self.db, self.dates, False, 2, 'absence', False, DatasetWriter(self.folder.name))
+
+    def test_writer_skips_worklogs_without_domain(self):
+        data = self.db.data.copy()
+        data.loc[len(data)] = data.iloc[0]
+        data.loc[len(data) - 1, 'domain'] = None
+        db = DataBuilder(data)
+
+        expected = create_dataset(db, self.dates, True, 3, 'even', True)
+        writer = DatasetWriter(self.folder.name)
+        create_dataset(db, self.dates, True, 3, 'even', True, writer)
+        pd.testing.assert_frame_equal(writer.read(), expected)
+
+    def test_no_dates(self):
+        self.assertTrue(create_dataset(self.db, []).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
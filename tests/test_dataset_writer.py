@@ -0,0 +1,68 @@
+import tempfile
+import unittest
+
+import pandas as pd
+
+from utils.dataset_writer import DatasetWriter
+
+
+class TestDatasetWriter(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.writer = DatasetWriter(self.folder.name)
+        self.period = ('2024-10-01', '2024-10-14')
+        self.dataset = pd.DataFrame({'mean': [8.0, 4.0], 0: [8.0, 0.0], 'target': [0.5, 0.7]},
+                                    index=pd.Index(['author0_2024-10-01_2024-10-14',
+                                                    'author1_2024-10-01_2024-10-14'], name='author'))
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_write_and_read(self):
+        self.writer.write(self.dataset, *self.period, 'zeta')
+        self.writer.write(self.dataset.iloc[:1], *self.period, 'domain/1')
+
+        self.assertEqual(self.writer.get_partitions(),
+                         [('2024-10-01', '2024-10-14', 'zeta'), ('2024-10-01', '2024-10-14', 'domain/1')])
+        pd.testing.assert_frame_equal(self.writer.read(domains=['zeta']), self.dataset)
+        pd.testing.assert_frame_equal(self.writer.read(), pd.concat([self.dataset, self.dataset.iloc[:1]]))
+
+    def test_read_in_order_of_writing_after_resume(self):
+        self.writer.write(self.dataset, '2024-10-15', '2024-10-31', 'zeta')
+        self.writer.write(self.dataset, *self.period, 'zeta')
+
+        writer = DatasetWriter(self.folder.name)
+        writer.write(self.dataset, *self.period, 'alpha')
+        self.assertEqual(writer.get_partitions(periods=[self.period]),
+                         [('2024-10-01', '2024-10-14', 'zeta'), ('2024-10-01', '2024-10-14', 'alpha')])
+
+    def test_read_selected_partitions_lazily(self):
+        self.writer.write(self.dataset, *self.period, 'domain0')
+        self.writer.write(self.dataset, '2024-10-15', '2024-10-31', 'domain0')
+
+        partitions = self.writer.iter_partitions(periods=[self.period], columns=['target'])
+        self.assertEqual(list(next(partitions)['target']), [0.5, 0.7])
+        self.assertIsNone(next(partitions, None))
+
+    def test_other_parameters_are_refused(self):
+        self.writer.set_parameters({'n_periods': 3, 'strategy': 'even'})
+        self.writer.write(self.dataset, *self.period, 'domain0')
+
+        writer = DatasetWriter(self.folder.name)
+        writer.set_parameters({'n_periods': 3, 'strategy': 'even'})
+        with self.assertRaises(ValueError):
+            writer.set_parameters({'n_periods': 2, 'strategy': 'even'})
+
+    def test_checkpoint_is_restored(self):
+        self.writer.write(self.dataset, *self.period, 'domain0')
+        self.writer.write(pd.DataFrame(), *self.period, 'domain1')
+
+        writer = DatasetWriter(self.folder.name)
+        self.assertTrue(writer.is_completed(*self.period, 'domain0'))
+        self.assertTrue(writer.is_completed(*self.period, 'domain1'))
+        self.assertFalse(writer.is_completed('2024-10-15', '2024-10-31', 'domain0'))
+        self.assertEqual(writer.get_partitions(), [('2024-10-01', '2024-10-14', 'domain0')])
+
+
+if __name__ == '__main__':
+    unittest.main()
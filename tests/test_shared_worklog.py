@@ -0,0 +1,86 @@
+import multiprocessing
+import os
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import resource_tracker
+
+import pandas as pd
+
+from utils.data_loader import DataLoader
+from utils.shared_worklog import AttachedWorklog, SharedWorklog, attach_shared_memory
+from utils.worklog_cube import WorklogCube
+
+
+def sum_author_hours(handle, author, queue):
+    worklog = AttachedWorklog(handle)
+    queue.put(float(worklog.create_series_logged_time(author).sum()))
+    worklog.close()
+
+
+def attach_and_crash(handle):
+    AttachedWorklog(handle)
+    os._exit(1)
+
+
+class TestSharedWorklog(unittest.TestCase):
+    def setUp(self):
+        dl = DataLoader('../data_sample/tempo_db_masked_sample.csv')
+        self.cube = WorklogCube(dl.get_data())
+        self.date_from = '2024-10-01'
+        self.date_until = '2024-10-14'
+        self.shared = SharedWorklog(self.cube, self.date_from, self.date_until, ignore_weekends=True)
+        self.context = multiprocessing.get_context('spawn')
+
+    def tearDown(self):
+        self.shared.close()
+
+    def test_attached_worklog(self):
+        worklog = AttachedWorklog(pickle.loads(pickle.dumps(self.shared.get_handle())))
+
+        series = worklog.create_series_logged_time('author0')
+        expected = self.cube.create_series_logged_time('author0', self.date_from, self.date_until, True)
+        pd.testing.assert_series_equal(series, expected)
+        self.assertFalse(series.values.flags.writeable)
+        self.assertEqual(worklog.get_worklog_matrix().shape, (2, 10))
+        self.assertEqual(dict(worklog.get_issue_hours('author0')), {'issuekey0': 74.0, 'issuekey1': 6.0})
+
+        worklog.close()
+
+    def test_attach_from_threads(self):
+        register = resource_tracker.register
+        handle = self.shared.get_handle()
+        with ThreadPoolExecutor(8) as executor:
+            worklogs = list(executor.map(lambda _: AttachedWorklog(handle), range(64)))
+
+        self.assertIs(resource_tracker.register, register)
+        for worklog in worklogs:
+            worklog.close()
+
+    def test_worker_process(self):
+        queue = self.context.Queue()
+        process = self.context.Process(target=sum_author_hours, args=(self.shared.get_handle(), 'author1', queue))
+        process.start()
+        self.assertEqual(queue.get(timeout=30), 1.0)
+        process.join()
+
+    def test_worker_crash_keeps_segments(self):
+        process = self.context.Process(target=attach_and_crash, args=(self.shared.get_handle(),))
+        process.start()
+        process.join()
+        self.assertEqual(process.exitcode, 1)
+
+        worklog = AttachedWorklog(self.shared.get_handle())
+        self.assertEqual(worklog.create_series_logged_time('author0').sum(), 80.0)
+        worklog.close()
+
+    def test_close_unlinks_segments(self):
+        names = [name for name, _, _ in self.shared.get_handle().segments.values()]
+        self.shared.close()
+        for name in names:
+            with self.assertRaises(FileNotFoundError):
+                attach_shared_memory(name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+
+from utils.data_builder import DataBuilder
+from utils.data_loader import DataLoader
+from utils.tempo_client import TempoClient, TEMPO_WORKLOG_COLUMNS
+
+from tests.tempo_stub_server import TempoStubServer, make_worklog
+
+
+class TestTempoClient(unittest.TestCase):
+    def setUp(self):
+        self.worklogs = [make_worklog(i, 'author' + str(i % 3), f'2024-10-{i % 28 + 1:02d}T12:00:00Z', 1800 * (i + 1))
+                         for i in range(23)]
+        self.folder = tempfile.TemporaryDirectory()
+        self.watermark_path = os.path.join(self.folder.name, 'watermark.json')
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_fetch_all_pages(self):
+        with TempoStubServer(self.worklogs) as server:
+            client = TempoClient(server.get_base_url(), pool_size=2, page_limit=5)
+            data = client.fetch()
+
+        self.assertEqual(list(data.columns), TEMPO_WORKLOG_COLUMNS)
+        self.assertEqual(sorted(data.index), list(range(23)))
+        self.assertEqual(data.loc[3, 'hour'], 2.0)
+        self.assertEqual(data.loc[3, 'updated'], '2024-10-04 12:00:00')
+        # 5 pages and last position requested again
+        self.assertEqual(len(server.requests), 7)
+
+    def test_fetch_retries_failed_requests(self):
+        with TempoStubServer(self.worklogs, n_failures=3) as server:
+            client = TempoClient(server.get_base_url(), pool_size=2, page_limit=10, backoff=0.01)
+            data = client.fetch()
+
+        self.assertEqual(len(data), 23)
+
+    def test_fetch_raises_after_max_retries(self):
+        with TempoStubServer(self.worklogs, n_failures=100) as server:
+            client = TempoClient(server.get_base_url(), pool_size=1, max_retries=2, backoff=0.01)
+            with self.assertRaises(ConnectionError):
+                client.fetch()
+
+    def test_fetch_since_watermark(self):
+        with TempoStubServer(self.worklogs) as server:
+            client = TempoClient(server.get_base_url(), page_limit=5, watermark_path=self.watermark_path)
+            client.fetch()
+            self.assertIsNone(client.get_watermark())
+            client.commit_watermark()
+            self.assertEqual(client.get_watermark(), '2024-10-23 12:00:00')
+
+            server.worklogs.append(make_worklog(100, 'author0', '2024-10-29T09:30:00Z'))
+            data = client.fetch()
+            client.commit_watermark()
+
+        self.assertEqual(list(data.index), [22, 100])
+        self.assertEqual(server.requests[-1]['updatedFrom'], '2024-10-23T12:00:00Z')
+        self.assertEqual(client.get_watermark(), '2024-10-29 09:30:00')
+
+    def test_fetch_repeats_pass_when_worklog_moves(self):
+        def update_first_worklog(stub, params):
+            # page boundary worklog shifts into already fetched first page
+            if params['offset'] == '5' and len(stub.requests) == 2:
+                now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+                stub.worklogs[1] = make_worklog(1, 'author1', now, 7200)
+
+        with TempoStubServer(self.worklogs, on_request=update_first_worklog) as server:
+            client = TempoClient(server.get_base_url(), pool_size=1, page_limit=5,
+                                 watermark_path=self.watermark_path)
+            data = client.fetch()
+
+        self.assertEqual(sorted(data.index), list(range(23)))
+        self.assertEqual(data.loc[1, 'hour'], 2.0)
+        self.assertEqual(len(server.requests), 12)
+        self.assertEqual(client.pending_watermark, data.loc[1, 'updated'])
+
+    def test_fetch_repeats_pass_only_after_complete_pages(self):
+        def update_first_worklog(stub, params):
+            # first two pages are served before the update, worklog 10 shifts into the second one
+            if params['offset'] == '10' and len(stub.requests) == 3:
+                time.sleep(1.1)
+                now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+                stub.worklogs[1] = make_worklog(1, 'author1', now, 7200)
+
+        with TempoStubServer(self.worklogs, on_request=update_first_worklog) as server:
+            client = TempoClient(server.get_base_url(), pool_size=1, page_limit=5)
+            data = client.fetch()
+
+        self.assertEqual(sorted(data.index), list(range(23)))
+        self.assertEqual(server.requests[6]['updatedFrom'], '2024-10-10T12:00:00Z')
+        self.assertEqual(len(server.requests), 11)
+        self.assertEqual(client.pending_watermark, data.loc[1, 'updated'])
+
+    def test_fetch_keeps_watermark_when_no_pass_is_stable(self):
+        def update_first_worklog(stub, params):
+            if params['offset'] == '0':
+                now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+                stub.worklogs[1] = make_worklog(1, 'author1', now, 7200)
+
+        with TempoStubServer(self.worklogs, on_request=update_first_worklog) as server:
+            client = TempoClient(server.get_base_url(), pool_size=1, page_limit=5, max_passes=2,
+                                 watermark_path=self.watermark_path)
+            with self.assertWarns(UserWarning):
+                data = client.fetch()
+            client.commit_watermark()
+
+        self.assertEqual(sorted(data.index), list(range(23)))
+        self.assertIsNone(client.get_watermark())
+
+    def test_failed_update_csv_keeps_watermark(self):
+        path = os.path.join(self.folder.name, 'missing', 'tempo.csv')
+        with TempoStubServer(self.worklogs) as server:
+            client = TempoClient(server.get_base_url(), page_limit=5, watermark_path=self.watermark_path)
+            client.fetch()
+            with self.assertRaises(OSError):
+                client.update_csv(path)
+            self.assertIsNone(client.get_watermark())
+
+            self.assertEqual(len(client.fetch()), 23)
+
+    def test_update_csv_readable_by_data_loader(self):
+        path = os.path.join(self.folder.name, 'tempo.csv')
+        with TempoStubServer(self.worklogs) as server:
+            client = TempoClient(server.get_base_url(), page_limit=5)
+            client.fetch()
+            client.update_csv(path)
+
+            server.worklogs = [make_worklog(0, 'author0', '2024-10-01T18:00:00Z', 7200)]
+            client.fetch(updated_from='2024-10-01 13:00:00')
+            client.update_csv(path)
+
+        data = DataLoader(path).get_data()
+        self.assertEqual(len(data), 23)
+        self.assertEqual(data.loc[0, 'hour'], 2.0)
+
+        db = DataBuilder(data)
+        self.assertEqual(db.create_series_logged_time('author0', '2024-10-01', '2024-10-01').sum(), 2.0)
+
+    def test_update_csv_refuses_data_loader_export(self):
+        path = os.path.join(self.folder.name, 'tempo.csv')
+        DataLoader('../data_sample/tempo_db_masked_sample.csv').get_data().to_csv(path)
+        with TempoStubServer(self.worklogs) as server:
+            client = TempoClient(server.get_base_url(), page_limit=5, watermark_path=self.watermark_path)
+            client.fetch()
+            with self.assertRaises(ValueError):
+                client.update_csv(path)
+
+        self.assertIsNone(client.get_watermark())
+        self.assertEqual(len(DataLoader(path).get_data()), 21)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+
+import pandas as pd
+
+from utils.data_builder import DataBuilder
+from utils.data_loader import DataLoader
+from utils.worklog_cube import WorklogCube
+
+from metrics import cube_based
+from metrics import tempo_based
+
+
+class TestWorklogCube(unittest.TestCase):
+    def setUp(self):
+        dl = DataLoader('../data_sample/tempo_db_masked_sample.csv')
+        self.db = DataBuilder(dl.get_data())
+        self.cube = WorklogCube(self.db.data)
+        self.date_from = '2024-10-01'
+        self.date_until = '2024-10-14'
+
+    def test_create_series_logged_time(self):
+        for ignore_weekends in [False, True]:
+            expected = self.db.create_series_logged_time('author0', self.date_from, self.date_until, ignore_weekends)
+            values = self.cube.create_series_logged_time('author0', self.date_from, self.date_until, ignore_weekends)
+            pd.testing.assert_series_equal(values, expected)
+
+    def test_rollup(self):
+        values = self.cube.rollup('W', ['domain', 'author'], date_from=self.date_from, date_until=self.date_until)
+        self.assertEqual(list(values), [16.0, 56.0, 8.0, 1.0])
+        self.assertEqual(self.cube.rollup('Q')['domain0'].iloc[0], 80.0)
+        with self.assertRaises(ValueError):
+            self.cube.rollup('Y')
+
+    def test_get_team_matrix(self):
+        matrix = self.cube.get_team_matrix('domain0', self.date_from, self.date_until)
+        self.assertEqual(matrix.shape, (1, 14))
+        self.assertEqual(matrix.loc['author0'].sum(), 80.0)
+
+    def test_get_distinct_issues(self):
+        self.assertEqual(self.cube.get_distinct_issues('domain0', self.date_from, self.date_until), 2)
+        self.assertEqual(self.cube.get_distinct_issues('domain0', self.date_from, self.date_until, 'author0'), 2)
+        self.assertEqual(self.cube.get_distinct_issues('domain1', self.date_from, self.date_until), 1)
+
+    def test_metrics_match_raw_rows(self):
+        data = self.db.get_employee_worklog_in_period('author0', self.date_from, self.date_until)
+        data_domain = self.db.get_domain_worklog_in_period('domain0', self.date_from, self.date_until)
+
+        for strategy in tempo_based.WEIGHTED_METRIC_STRATEGIES:
+            expected = tempo_based.compute_weighted_target(data, data_domain, self.date_from, self.date_until,
+                                                           strategy)
+            value = cube_based.compute_weighted_target(self.cube, 'author0', 'domain0', self.date_from,
+                                                       self.date_until, strategy)
+            self.assertAlmostEqual(value, expected)
+
+    def test_metrics_match_raw_rows_for_author_in_two_domains(self):
+        data = pd.DataFrame({
+            'issuekey': ['issuekey0', 'issuekey1', 'issuekey0', 'issuekey2', 'issuekey3'],
+            'date': ['2024-10-01', '2024-10-02', '2024-10-01', '2024-10-03', '2024-10-04'],
+            'hour': [8.0, 4.0, 2.0, 6.0, 8.0],
+            'author': ['author0', 'author0', 'author1', 'author1', 'author1'],
+            'updated': ['2024-10-01 18:00:00', '2024-10-02 18:00:00', '2024-10-01 18:00:00', '2024-10-03 18:00:00',
+                        '2024-10-04 18:00:00'],
+            'issue_type': ['Task', 'Bug', 'Task', 'Task', 'Task'],
+            'issue_summary': ['Task', 'Bug', 'Task', 'Task', 'Отпуск'],
+            'domain': ['domain0', 'domain1', 'domain0', 'domain0', 'domain0'],
+        })
+        db = DataBuilder(data)
+        cube = WorklogCube(db.data)
+
+        # issuekey1 is logged by author0 in domain1, but still counts towards share in domain0
+        self.assertAlmostEqual(cube_based.compute_initiative_share_by_domain(cube, 'author0', 'domain0',
+                                                                             self.date_from, self.date_until), 2 / 3)
+        for author, domain in [('author0', 'domain0'), ('author0', 'domain1'), ('author1', 'domain0')]:
+            author_data = db.get_employee_worklog_in_period(author, self.date_from, self.date_until)
+            domain_data = db.get_domain_worklog_in_period(domain, self.date_from, self.date_until)
+            expected = tempo_based.compute_weighted_target(author_data, domain_data, self.date_from,
+                                                           self.date_until)
+            value = cube_based.compute_weighted_target(cube, author, domain, self.date_from, self.date_until)
+            self.assertAlmostEqual(value, expected)
+
+    def test_worklog_without_domain_counts_for_author(self):
+        data = pd.DataFrame({
+            'issuekey': ['issuekey0', 'issuekey1', 'issuekey2'],
+            'date': ['2024-10-01', '2024-10-02', '2024-10-03'],
+            'hour': [8.0, 4.0, 6.0],
+            'author': ['author0', 'author0', 'author1'],
+            'updated': ['2024-10-01 18:00:00', '2024-10-02 18:00:00', '2024-10-03 18:00:00'],
+            'issue_type': ['Task', 'Bug', 'Task'],
+            'issue_summary': ['Task', 'Bug', 'Task'],
+            'domain': ['domain0', None, 'domain0'],
+        })
+        db = DataBuilder(data)
+        cube = WorklogCube(db.data)
+
+        self.assertEqual(cube.get_domains(), ['domain0'])
+        pd.testing.assert_series_equal(cube.create_series_logged_time('author0', self.date_from, self.date_until),
+                                       db.create_series_logged_time('author0', self.date_from, self.date_until))
+        author_data = db.get_employee_worklog_in_period('author0', self.date_from, self.date_until)
+        domain_data = db.get_domain_worklog_in_period('domain0', self.date_from, self.date_until)
+        for strategy in tempo_based.WEIGHTED_METRIC_STRATEGIES:
+            expected = tempo_based.compute_weighted_target(author_data, domain_data, self.date_from,
+                                                           self.date_until, strategy)
+            value = cube_based.compute_weighted_target(cube, 'author0', 'domain0', self.date_from, self.date_until,
+                                                       strategy)
+            self.assertAlmostEqual(value, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
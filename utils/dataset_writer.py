@@ -0,0 +1,131 @@
+import json
+import os
+from urllib.parse import quote
+
+import pandas as pd
+
+CHECKPOINT_FILE_NAME = '_checkpoint.json'
+PARTITION_FILE_NAME = 'part.parquet'
+
+
+class DatasetWriter:
+    """
+    Class for saving dataset in parquet files partitioned by period and domain.
+
+    Partitions are stored as `<path>/period=<date_from>_<date_until>/domain=<domain>/part.parquet`. Each written
+    partition is recorded in checkpoint file together with dataset creation parameters, so an interrupted dataset
+    creation can skip completed partitions, while resuming with other parameters is refused. Partitions are read back
+    in the order they were written.
+    Column names and domains are stored as strings, week day columns are read back as `0`-`6` as in created
+    datasets.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.checkpoint_path = os.path.join(path, CHECKPOINT_FILE_NAME)
+        self.parameters: dict = None
+        self.completed: list[tuple[str, str, str]] = []
+
+        os.makedirs(path, exist_ok=True)
+        self.__load_checkpoint()
+
+    def __load_checkpoint(self):
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as file:
+                checkpoint = json.load(file)
+            self.parameters = checkpoint['parameters']
+            self.completed = [tuple(partition) for partition in checkpoint['completed']]
+
+    def __save_checkpoint(self):
+        tmp_path = self.checkpoint_path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump({'parameters': self.parameters, 'completed': self.completed}, file)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def set_parameters(self, parameters: dict):
+        """
+        Binds written partitions to dataset creation parameters.
+        :param parameters: json-serializable dict of parameters partitions are created with.
+        :raise ValueError: if partitions were written with other parameters.
+        """
+        parameters = json.loads(json.dumps(parameters))
+        if self.parameters is None:
+            self.parameters = parameters
+            self.__save_checkpoint()
+        elif self.parameters != parameters:
+            raise ValueError(f'Dataset in {self.path} was created with parameters {self.parameters}, not '
+                             f'{parameters}; use another path or remove it to start over')
+
+    def get_partition_path(self, date_from: str, date_until: str, domain: str):
+        return os.path.join(self.path, f'period={date_from}_{date_until}', 'domain=' + quote(str(domain), safe=''),
+                            PARTITION_FILE_NAME)
+
+    def is_completed(self, date_from: str, date_until: str, domain: str):
+        """
+        :return: whether partition of `domain` in period was already written.
+        """
+        return (date_from, date_until, str(domain)) in self.completed
+
+    def write(self, dataset: pd.DataFrame, date_from: str, date_until: str, domain: str):
+        """
+        Saves `domain` part of dataset in period and records it in checkpoint. Empty datasets are only recorded.
+        :param dataset: pd.DataFrame with features of `domain` authors.
+        :param date_from: start date in period.
+        :param date_until: end date in period.
+        :param domain: certain team of workers.
+        """
+        if not dataset.empty:
+            path = self.get_partition_path(date_from, date_until, domain)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # partition becomes visible only when it is fully written
+            dataset.rename(columns=str).to_parquet(path + '.tmp')
+            os.replace(path + '.tmp', path)
+
+        if not self.is_completed(date_from, date_until, domain):
+            self.completed.append((date_from, date_until, str(domain)))
+        self.__save_checkpoint()
+
+    def get_partitions(self, periods: list[tuple[str, str]] = None, domains: list[str] = None):
+        """
+        Lists written partitions, optionally filtered.
+        :param periods: list of pairs (<start date in period>, <end date in period>) to select (all if `None`).
+        :param domains: list of domains to select (all if `None`).
+        :return: list of (<start date in period>, <end date in period>, <domain>) in order of writing.
+        """
+        partitions = []
+        for date_from, date_until, domain in self.completed:
+            if periods is not None and (date_from, date_until) not in periods:
+                continue
+            if domains is not None and domain not in domains:
+                continue
+            # empty datasets are recorded without partition file
+            if os.path.exists(self.get_partition_path(date_from, date_until, domain)):
+                partitions.append((date_from, date_until, domain))
+        return partitions
+
+    def iter_partitions(self, periods: list[tuple[str, str]] = None, domains: list[str] = None,
+                        columns: list[str] = None):
+        """
+        Lazily loads selected partitions one by one.
+        :param periods: list of pairs (<start date in period>, <end date in period>) to select (all if `None`).
+        :param domains: list of domains to select (all if `None`).
+        :param columns: columns to load (all if `None`).
+        :return: generator of pd.DataFrame partitions.
+        """
+        if columns is not None:
+            columns = [str(column) for column in columns]
+        for date_from, date_until, domain in self.get_partitions(periods, domains):
+            dataset = pd.read_parquet(self.get_partition_path(date_from, date_until, domain), columns=columns)
+            yield dataset.rename(columns=lambda column: int(column) if column.isdigit() else column)
+
+    def read(self, periods: list[tuple[str, str]] = None, domains: list[str] = None, columns: list[str] = None):
+        """
+        Loads selected partitions into single dataset.
+        :param periods: list of pairs (<start date in period>, <end date in period>) to select (all if `None`).
+        :param domains: list of domains to select (all if `None`).
+        :param columns: columns to load (all if `None`).
+        :return: pd.DataFrame dataset.
+        """
+        partitions = list(self.iter_partitions(periods, domains, columns))
+        if not partitions:
+            return pd.DataFrame()
+        return pd.concat(partitions)
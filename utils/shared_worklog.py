@@ -0,0 +1,191 @@
+import sys
+import threading
+import weakref
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+
+from utils.worklog_cube import WorklogCube
+
+WORKLOG_SEGMENT = 'worklog'
+ISSUE_AUTHORS_SEGMENT = 'issue_authors'
+ISSUE_KEYS_SEGMENT = 'issue_keys'
+ISSUE_HOURS_SEGMENT = 'issue_hours'
+
+# guards temporary replacement of `resource_tracker.register` (before python 3.13) from other threads
+RESOURCE_TRACKER_LOCK = threading.Lock()
+
+
+class SharedWorklogHandle:
+    """
+    Lightweight picklable description of worklog published by `SharedWorklog`: names, shapes and dtypes of shared
+    memory segments and labels of their rows and columns. Workers pass it to `AttachedWorklog`.
+    """
+    def __init__(self, segments: dict[str, tuple[str, tuple, str]], authors: list[str], days: list,
+                 issuekeys: list[str]):
+        self.segments = segments
+        self.authors = authors
+        self.days = days
+        self.issuekeys = issuekeys
+
+
+class SharedWorklog:
+    """
+    Class for publishing worklog aggregates into shared memory once, so that worker processes attach to them
+    without copying or pickling raw data.
+
+    Published arrays:
+
+    * `worklog` -- matrix of hours physically logged by each author (rows) on each day (columns) in period.
+    * `issue_authors`, `issue_keys`, `issue_hours` -- hours logged by author on issue in period, as positions in
+      authors and issue keys labels.
+
+    Segments are owned by this object and unlinked by `close` (on context exit, garbage collection or interpreter
+    exit). Workers never own segments, so a crashed worker neither leaks nor destroys them; if the owner process
+    itself crashes, segments are unlinked by its resource tracker.
+    """
+    def __init__(self, cube: WorklogCube, date_from: str, date_until: str, ignore_weekends: bool = False):
+        self.shared_memory: dict[str, SharedMemory] = {}
+        self.handle: SharedWorklogHandle
+        self.__finalizer = weakref.finalize(self, release_shared_memory, self.shared_memory)
+
+        self.__publish(cube, date_from, date_until, ignore_weekends)
+
+    def __publish(self, cube: WorklogCube, date_from: str, date_until: str, ignore_weekends: bool):
+        days = pd.date_range(date_from, date_until, freq='D')
+        if ignore_weekends:
+            days = days[days.weekday < 5]
+
+        cells = cube.select(None, None, date_from, date_until)
+        worklog = cells.groupby(['author', 'day'], observed=True).hour.sum().unstack('day', fill_value=0.0)
+        worklog = worklog.reindex(columns=days, fill_value=0.0)
+        authors = list(worklog.index)
+
+        issues = cube.select_issues(None, None, date_from, date_until)
+        issue_hours = issues.groupby(['author', 'issuekey'], observed=True).hour.sum().reset_index()
+        issuekeys = list(issue_hours['issuekey'].unique())
+
+        arrays = {
+            WORKLOG_SEGMENT: worklog.to_numpy(dtype=np.float64),
+            ISSUE_AUTHORS_SEGMENT: pd.Index(authors).get_indexer(issue_hours['author']).astype(np.int32),
+            ISSUE_KEYS_SEGMENT: pd.Index(issuekeys).get_indexer(issue_hours['issuekey']).astype(np.int32),
+            ISSUE_HOURS_SEGMENT: issue_hours['hour'].to_numpy(dtype=np.float64),
+        }
+
+        segments = {}
+        for key, array in arrays.items():
+            # zero-size segments are not allowed
+            with RESOURCE_TRACKER_LOCK:
+                memory = SharedMemory(create=True, size=max(array.nbytes, 1))
+            self.shared_memory[key] = memory
+            np.ndarray(array.shape, array.dtype, buffer=memory.buf)[...] = array
+            segments[key] = (memory.name, array.shape, array.dtype.str)
+
+        self.handle = SharedWorklogHandle(segments, authors, list(days.date), issuekeys)
+
+    def get_handle(self):
+        return self.handle
+
+    def close(self):
+        """
+        Unlinks shared memory segments. Workers still attached keep their mappings until they close them.
+        """
+        self.__finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class AttachedWorklog:
+    """
+    Worker side read-only view of worklog published by `SharedWorklog`. Arrays are backed by shared memory, no data
+    is copied on attach.
+    """
+    def __init__(self, handle: SharedWorklogHandle):
+        self.handle = handle
+        self.shared_memory: dict[str, SharedMemory] = {}
+        self.arrays: dict[str, np.ndarray] = {}
+        self.authors = pd.Index(handle.authors)
+        self.__finalizer = weakref.finalize(self, release_shared_memory, self.shared_memory, False)
+
+        for key, (name, shape, dtype) in handle.segments.items():
+            memory = attach_shared_memory(name)
+            self.shared_memory[key] = memory
+            array = np.ndarray(shape, dtype, buffer=memory.buf)
+            array.flags.writeable = False
+            self.arrays[key] = array
+
+    def get_worklog_matrix(self):
+        """
+        :return: pd.DataFrame of hours physically logged by authors (index) on days (columns).
+        """
+        return pd.DataFrame(self.arrays[WORKLOG_SEGMENT], index=self.authors, columns=self.handle.days, copy=False)
+
+    def create_series_logged_time(self, author: str):
+        """
+        Same as `DataBuilder.create_series_logged_time` in published period.
+        :param author: login of worker who logged time.
+        :return: pd.Series with physical `author`'s worklog.
+        """
+        row = self.arrays[WORKLOG_SEGMENT][self.authors.get_loc(author)]
+        return pd.Series(row, index=self.handle.days, copy=False)
+
+    def get_issue_hours(self, author: str):
+        """
+        :param author: login of worker who logged time.
+        :return: pd.Series of hours logged by `author` on each issue in published period.
+        """
+        mask = self.arrays[ISSUE_AUTHORS_SEGMENT] == self.authors.get_loc(author)
+        issuekeys = [self.handle.issuekeys[idx] for idx in self.arrays[ISSUE_KEYS_SEGMENT][mask]]
+        return pd.Series(self.arrays[ISSUE_HOURS_SEGMENT][mask], index=pd.Index(issuekeys, name='issuekey'))
+
+    def close(self):
+        """
+        Detaches from shared memory. Arrays and frames obtained from this object must not be used afterwards.
+        """
+        self.arrays.clear()
+        self.__finalizer()
+
+
+def attach_shared_memory(name: str):
+    """
+    Attaches to existing shared memory segment without registering it in resource tracker, which would otherwise
+    unlink segment owned by another process as soon as this process exits. Safe to call from several threads.
+    :param name: name of segment.
+    :return: SharedMemory object.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+
+    with RESOURCE_TRACKER_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args: None
+        try:
+            return SharedMemory(name)
+        finally:
+            resource_tracker.register = register
+
+
+def release_shared_memory(shared_memory: dict[str, SharedMemory], unlink: bool = True):
+    """
+    Closes (and optionally unlinks) shared memory segments.
+    :param shared_memory: dict of SharedMemory objects, emptied afterwards.
+    :param unlink: whether to destroy segments or just detach from them.
+    """
+    for memory in shared_memory.values():
+        try:
+            memory.close()
+        except BufferError:
+            # numpy views are still alive, mapping is released with them
+            pass
+        if unlink:
+            try:
+                memory.unlink()
+            except FileNotFoundError:
+                pass
+    shared_memory.clear()
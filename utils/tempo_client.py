@@ -0,0 +1,298 @@
+import asyncio
+import http.client
+import json
+import os
+import warnings
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode, urlsplit
+
+import pandas as pd
+
+from utils.data_builder import DATETIME_FORMAT
+
+TEMPO_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+TEMPO_WORKLOG_COLUMNS = ['issuekey', 'date', 'hour', 'author', 'comment', 'updated', 'issue_type', 'issue_summary',
+                         'domain']
+WORKLOG_ID_COLUMN_NAME = 'worklog_id'
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+# `Date` header and `updatedAt` have seconds precision
+REPEAT_PASS_DELAY = 1.0
+
+
+class TempoClient:
+    """
+    Class for fetching Jira tempo worklogs from a paginated REST endpoint (`<base_url>/worklogs`).
+
+    Pages are requested concurrently over a bounded pool of keep-alive connections, failed requests are retried
+    with exponential backoff. Only worklogs updated since the last stored `updated` value (watermark) are requested
+    if `watermark_path` is given. Watermark of fetched worklogs is stored only by `commit_watermark` (called by
+    `update_csv` once worklogs are saved), so worklogs that were fetched but not saved are requested again.
+
+    Offset pagination over worklogs sorted by `updatedAt` is not stable: a worklog updated during fetching moves to
+    the end and shifts the following ones to lower offsets, so one worklog at a page boundary can be skipped. Such a
+    pass is detected by worklogs updated after the pass started (by server `Date` header). Pages served before the
+    first update are complete, so the query is repeated only from the last of their worklogs, up to `max_passes`
+    times. If no pass is stable, fetched worklogs are kept and the watermark is advanced only to the complete pages
+    (with a warning), so the next fetch requests the rest again. Deleted worklogs shift pages too but are not
+    detected.
+
+    Assumes endpoint to accept `offset`, `limit` and `updatedFrom` query parameters and to respond with
+    `{"metadata": {...}, "results": [...]}` where each result contains the following fields:
+
+    * `tempoWorklogId` -- unique id of worklog.
+    * `issue` -- dict with `key`, `type` and `summary` of issue on which time was logged.
+    * `startDate` -- date on which the work was logged on.
+    * `timeSpentSeconds` -- amount of work seconds logged on issue.
+    * `author` -- dict with `accountId` of worker who logged time.
+    * `description` -- comment left on logged time.
+    * `updatedAt` -- datetime of logging event.
+    * `team` -- dict with `name` of team which `author` belongs to.
+
+    Fetched data has the same columns as `DataLoader` data and is indexed by `worklog_id`.
+    """
+    def __init__(self, base_url: str, token: str = None, pool_size: int = 4, page_limit: int = 1000,
+                 max_retries: int = 3, backoff: float = 0.5, timeout: float = 30.0, watermark_path: str = None,
+                 max_passes: int = 3):
+        url = urlsplit(base_url)
+        self.scheme = url.scheme
+        self.host = url.hostname
+        self.port = url.port
+        self.path = url.path.rstrip('/') + '/worklogs'
+
+        self.headers = {'Accept': 'application/json'}
+        if token is not None:
+            self.headers['Authorization'] = 'Bearer ' + token
+
+        self.pool_size = pool_size
+        self.page_limit = page_limit
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.watermark_path = watermark_path
+        self.max_passes = max_passes
+        self.data: pd.DataFrame = pd.DataFrame(columns=TEMPO_WORKLOG_COLUMNS)
+        self.pending_watermark: str = None
+
+    def __new_connection(self):
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def __page_path(self, offset: int, updated_from: str = None):
+        params = {'offset': offset, 'limit': self.page_limit}
+        if updated_from is not None:
+            params['updatedFrom'] = updated_from
+        return self.path + '?' + urlencode(params)
+
+    def __request(self, connection: http.client.HTTPConnection, path: str):
+        """
+        Blocking GET request over given keep-alive connection.
+        :return: response status, body and server time of response (naive UTC).
+        """
+        connection.request('GET', path, headers=self.headers)
+        response = connection.getresponse()
+        date = response.getheader('Date')
+        if date is not None:
+            date = parsedate_to_datetime(date).astimezone(timezone.utc).replace(tzinfo=None)
+        else:
+            date = datetime.now(timezone.utc).replace(tzinfo=None)
+        return response.status, response.read(), date
+
+    async def __fetch_page(self, pool: asyncio.Queue, offset: int, updated_from: str = None):
+        """
+        Fetches single page, retrying with exponential backoff on connection errors and `RETRY_STATUS_CODES`.
+        :param pool: queue of idle connections.
+        :param offset: offset of first worklog in page.
+        :param updated_from: watermark, only worklogs updated since it are requested.
+        :return: list of worklogs in page and server time of response.
+        """
+        path = self.__page_path(offset, updated_from)
+        status = None
+        for attempt in range(self.max_retries + 1):
+            connection = await pool.get()
+            try:
+                status, body, date = await asyncio.to_thread(self.__request, connection, path)
+            except (OSError, http.client.HTTPException):
+                # broken connection is reopened on next request
+                connection.close()
+                status, body, date = None, None, None
+            finally:
+                pool.put_nowait(connection)
+
+            if status == 200:
+                return json.loads(body)['results'], date
+            if status is not None and status not in RETRY_STATUS_CODES:
+                break
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+        raise ConnectionError(f'Failed to fetch {path} (last status: {status})')
+
+    async def __fetch_pass(self, pool: asyncio.Queue, updated_from: str = None):
+        """
+        Fetches all pages once. Pages are requested in waves of `pool_size` concurrent requests until a page shorter
+        than `page_limit` is met, then the page at the last position is requested again to catch worklogs moved to
+        the end after their page was served.
+        :param pool: queue of idle connections.
+        :param updated_from: watermark, only worklogs updated since it are requested.
+        :return: list of pairs (<worklogs>, <server time of response>) in offset order and worklogs of last position.
+        """
+        pages = []
+        offset = 0
+        is_last_page = False
+        while not is_last_page:
+            offsets = [offset + i * self.page_limit for i in range(self.pool_size)]
+            # all requests of the wave are awaited, so connections are back in pool before an error is raised
+            wave = await asyncio.gather(*[self.__fetch_page(pool, x, updated_from) for x in offsets],
+                                        return_exceptions=True)
+            for page in wave:
+                if isinstance(page, BaseException):
+                    raise page
+            for page in wave:
+                pages.append(page)
+                if len(page[0]) < self.page_limit:
+                    is_last_page = True
+                    break
+            offset = offsets[-1] + self.page_limit
+
+        n_worklogs = sum(len(page) for page, _ in pages)
+        tail, _ = await self.__fetch_page(pool, max(n_worklogs - 1, 0), updated_from)
+        return pages, tail
+
+    async def fetch_async(self, updated_from: str = None):
+        """
+        Fetches all worklogs updated since `updated_from`, repeating the query while worklogs are updated during it.
+        :param updated_from: watermark in `DATETIME_FORMAT` (if set `None`, stored watermark is used).
+        :return: pd.DataFrame of fetched worklogs.
+        """
+        if updated_from is None:
+            updated_from = self.get_watermark()
+        if updated_from is not None:
+            updated_from = datetime.strptime(updated_from, DATETIME_FORMAT).strftime(TEMPO_DATETIME_FORMAT)
+
+        connections = [self.__new_connection() for _ in range(self.pool_size)]
+        pool = asyncio.Queue()
+        for connection in connections:
+            pool.put_nowait(connection)
+
+        worklogs = []
+        is_stable = False
+        watermark = updated_from
+        try:
+            for n_pass in range(self.max_passes):
+                if n_pass > 0:
+                    await asyncio.sleep(REPEAT_PASS_DELAY)
+                pages, tail = await self.__fetch_pass(pool, watermark)
+                pass_worklogs = [worklog for page, _ in pages for worklog in page] + tail
+                worklogs += pass_worklogs
+
+                # `updatedAt` has seconds precision, so worklogs updated in the same second are treated as moved too
+                started = min(date for _, date in pages).replace(microsecond=0)
+                updates = [datetime.strptime(worklog['updatedAt'], TEMPO_DATETIME_FORMAT) for worklog in pass_worklogs]
+                updates = [x for x in updates if x >= started]
+                if not updates:
+                    is_stable = True
+                    break
+
+                # pages served before the first update are complete, only the following ones are requested again
+                for page, date in pages:
+                    if date.replace(microsecond=0) >= min(updates):
+                        break
+                    if page:
+                        watermark = page[-1]['updatedAt']
+        finally:
+            for connection in connections:
+                connection.close()
+
+        data = pd.DataFrame([worklog_to_row(worklog) for worklog in worklogs],
+                            columns=[WORKLOG_ID_COLUMN_NAME] + TEMPO_WORKLOG_COLUMNS)
+        # worklogs updated during fetching are met more than once, the latest version is kept
+        data = data.drop_duplicates(WORKLOG_ID_COLUMN_NAME, keep='last').set_index(WORKLOG_ID_COLUMN_NAME)
+
+        if is_stable:
+            self.pending_watermark = data['updated'].max() if not data.empty else None
+        else:
+            self.pending_watermark = None
+            if watermark != updated_from:
+                self.pending_watermark = datetime.strptime(watermark, TEMPO_DATETIME_FORMAT).strftime(DATETIME_FORMAT)
+            if self.pending_watermark is None:
+                warnings.warn(f'Worklogs were updated during each of {self.max_passes} passes, watermark is not '
+                              f'advanced')
+            else:
+                warnings.warn(f'Worklogs were updated during each of {self.max_passes} passes, watermark is advanced '
+                              f'only to {self.pending_watermark}')
+        self.data = data
+
+        return data
+
+    def fetch(self, updated_from: str = None):
+        """
+        Blocking wrap over `fetch_async`.
+        :param updated_from: watermark in `DATETIME_FORMAT` (if set `None`, stored watermark is used).
+        :return: pd.DataFrame of fetched worklogs.
+        """
+        return asyncio.run(self.fetch_async(updated_from))
+
+    def get_watermark(self):
+        """
+        :return: latest `updated` value of previously fetched worklogs or `None`.
+        """
+        if self.watermark_path is None or not os.path.exists(self.watermark_path):
+            return None
+        with open(self.watermark_path) as file:
+            return json.load(file)['updated']
+
+    def commit_watermark(self):
+        """
+        Stores watermark of last fetched worklogs. Call it only after fetched worklogs are saved.
+        """
+        if self.watermark_path is None or self.pending_watermark is None:
+            return
+        with open(self.watermark_path, 'w') as file:
+            json.dump({'updated': self.pending_watermark}, file)
+        self.pending_watermark = None
+
+    def update_csv(self, path: str):
+        """
+        Merges fetched worklogs into csv file readable by `DataLoader`, replacing previous versions of
+        updated worklogs, then commits watermark.
+        :param path: path to csv file (created if not exists).
+        :raise ValueError: if existing csv file is not indexed by `worklog_id` (e.g. plain `DataLoader` export).
+        """
+        data = self.data
+        if os.path.exists(path):
+            existing_data = pd.read_csv(path, encoding='utf-8', index_col=0)
+            if existing_data.index.name != WORKLOG_ID_COLUMN_NAME:
+                raise ValueError(f'{path} is not indexed by `{WORKLOG_ID_COLUMN_NAME}`, worklogs can not be merged '
+                                 f'into it')
+            data = pd.concat([existing_data, data])
+            data = data.loc[~data.index.duplicated(keep='last')]
+        data.to_csv(path, encoding='utf-8', index_label=WORKLOG_ID_COLUMN_NAME)
+        self.commit_watermark()
+
+    def get_data(self):
+        return self.data
+
+
+def worklog_to_row(worklog: dict):
+    """
+    Converts single tempo worklog to row with `DataLoader` columns.
+    :param worklog: worklog as returned by tempo endpoint.
+    :return: dict with `worklog_id` and `TEMPO_WORKLOG_COLUMNS` keys.
+    """
+    issue = worklog.get('issue') or {}
+    team = worklog.get('team') or {}
+    updated = datetime.strptime(worklog['updatedAt'], TEMPO_DATETIME_FORMAT)
+    return {
+        WORKLOG_ID_COLUMN_NAME: worklog['tempoWorklogId'],
+        'issuekey': issue.get('key'),
+        'date': worklog['startDate'],
+        'hour': worklog['timeSpentSeconds'] / 3600,
+        'author': worklog['author']['accountId'],
+        'comment': worklog.get('description'),
+        'updated': updated.strftime(DATETIME_FORMAT),
+        'issue_type': issue.get('type'),
+        'issue_summary': issue.get('summary'),
+        'domain': team.get('name'),
+    }
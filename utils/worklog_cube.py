@@ -0,0 +1,166 @@
+import pandas as pd
+from datetime import datetime
+
+from metrics.tempo_based import check_absence_keys_in_issue
+from utils.data_builder import DATETIME_FORMAT, START_DAY_TIME, END_DAY_TIME
+
+CUBE_DIMENSIONS = ['domain', 'author', 'day', 'issue_type', 'absence']
+ISSUE_DIMENSIONS = ['domain', 'author', 'day', 'issuekey']
+ROLLUP_FREQUENCIES = ['D', 'W', 'M', 'Q']
+
+
+class WorklogCube:
+    """
+    Pre-aggregated worklog for fast domain and team level queries.
+
+    Raw rows are aggregated once into sums of logged hours over (`domain`, `author`, `day`, `issue_type`, `absence`)
+    where `day` is the date of logging event (as in `DataBuilder`) and `absence` tells whether issue summary contains
+    `ABSENCE_ISSUE_KEYS`. Hours per issue are kept over (`domain`, `author`, `day`, `issuekey`) for distinct issue
+    counts, which are cached per domain and period.
+    """
+    def __init__(self, data: pd.DataFrame):
+        self.cube: pd.DataFrame
+        self.issues: pd.DataFrame
+        self.__distinct_issues_cache = {}
+
+        self.__build(data)
+
+    def __build(self, data: pd.DataFrame):
+        """
+        Aggregates raw worklog rows; free-text columns are not kept.
+        """
+        updated = data['updated']
+        if not pd.api.types.is_datetime64_any_dtype(updated):
+            updated = pd.to_datetime(updated, format=DATETIME_FORMAT)
+
+        summaries = data['issue_summary'].where(data['issue_summary'].notna(), None)
+        absence_map = {summary: check_absence_keys_in_issue(summary) for summary in summaries.unique()}
+
+        rows = pd.DataFrame({
+            # categories keep order of first appearance, as `unique` does on raw rows
+            'domain': pd.Categorical(data['domain'], categories=data['domain'].dropna().unique()),
+            'author': pd.Categorical(data['author'], categories=data['author'].dropna().unique()),
+            'day': updated.dt.normalize(),
+            'issue_type': data['issue_type'].fillna('').astype('category'),
+            'absence': summaries.map(absence_map).astype(bool),
+            'issuekey': data['issuekey'].astype('category'),
+            'hour': data['hour'],
+        })
+
+        # worklogs without team (`domain` is None) still count towards their author
+        self.cube = rows.groupby(CUBE_DIMENSIONS, observed=True, dropna=False).hour.sum().reset_index()
+        self.issues = rows.groupby(ISSUE_DIMENSIONS, observed=True, dropna=False).hour.sum().reset_index()
+
+    @staticmethod
+    def __select(table: pd.DataFrame, domain: str = None, author: str = None, date_from: str = None,
+                 date_until: str = None):
+        mask = pd.Series(True, index=table.index)
+        if domain is not None:
+            mask &= table['domain'] == domain
+        if author is not None:
+            mask &= table['author'] == author
+        if date_from is not None:
+            mask &= table['day'] >= datetime.strptime(date_from + START_DAY_TIME, DATETIME_FORMAT)
+        if date_until is not None:
+            mask &= table['day'] <= datetime.strptime(date_until + END_DAY_TIME, DATETIME_FORMAT)
+        return table.loc[mask]
+
+    def select(self, domain: str = None, author: str = None, date_from: str = None, date_until: str = None):
+        """
+        Selects cube cells, optionally filtered.
+        :param domain: certain team of workers.
+        :param author: login of worker who logged time.
+        :param date_from: start date in period.
+        :param date_until: end date in period.
+        :return: pd.DataFrame with `CUBE_DIMENSIONS` and `hour` columns.
+        """
+        return self.__select(self.cube, domain, author, date_from, date_until)
+
+    def select_issues(self, domain: str = None, author: str = None, date_from: str = None, date_until: str = None):
+        """
+        Selects hours logged per issue per day, optionally filtered.
+        :param domain: certain team of workers.
+        :param author: login of worker who logged time.
+        :param date_from: start date in period.
+        :param date_until: end date in period.
+        :return: pd.DataFrame with `ISSUE_DIMENSIONS` and `hour` columns.
+        """
+        return self.__select(self.issues, domain, author, date_from, date_until)
+
+    def get_domains(self):
+        return list(self.cube['domain'].dropna().unique())
+
+    def get_authors(self, domain: str = None, date_from: str = None, date_until: str = None):
+        return list(self.select(domain, None, date_from, date_until)['author'].unique())
+
+    def get_distinct_issues(self, domain: str, date_from: str, date_until: str, author: str = None):
+        """
+        Counts distinct issues on which time was logged in period. Domain counts are cached.
+        :param domain: certain team of workers (all domains if `None`).
+        :param date_from: start date in period.
+        :param date_until: end date in period.
+        :param author: login of worker who logged time (whole `domain` if `None`).
+        :return: number of distinct issues.
+        """
+        if author is not None:
+            return self.select_issues(domain, author, date_from, date_until)['issuekey'].nunique(dropna=False)
+
+        key = (domain, date_from, date_until)
+        if key not in self.__distinct_issues_cache:
+            self.__distinct_issues_cache[key] = self.select_issues(domain, None, date_from,
+                                                                   date_until)['issuekey'].nunique(dropna=False)
+        return self.__distinct_issues_cache[key]
+
+    def rollup(self, freq: str = 'W', by: list[str] = None, domain: str = None, author: str = None,
+               date_from: str = None, date_until: str = None):
+        """
+        Sums logged hours by time period and given dimensions.
+        :param freq: `D` (day), `W` (week), `M` (month) or `Q` (quarter).
+        :param by: dimensions from `CUBE_DIMENSIONS` to keep (default is `domain`).
+        :param domain: certain team of workers.
+        :param author: login of worker who logged time.
+        :param date_from: start date in period.
+        :param date_until: end date in period.
+        :return: pd.Series of hours indexed by `by` dimensions and `period`.
+        """
+        if freq not in ROLLUP_FREQUENCIES:
+            raise ValueError(f'Unknown frequency {freq}, expected one of {ROLLUP_FREQUENCIES}')
+        if by is None:
+            by = ['domain']
+
+        cells = self.select(domain, author, date_from, date_until)
+        period = cells['day'].dt.to_period(freq).rename('period')
+        return cells.groupby([cells[dimension] for dimension in by] + [period], observed=True).hour.sum()
+
+    def get_team_matrix(self, domain: str, date_from: str, date_until: str, freq: str = 'D'):
+        """
+        Creates matrix of hours physically logged by `domain` authors in each time period.
+        :param domain: certain team of workers.
+        :param date_from: start date in period.
+        :param date_until: end date in period.
+        :param freq: `D` (day), `W` (week), `M` (month) or `Q` (quarter).
+        :return: pd.DataFrame with authors as index and all time periods from `date_from` to `date_until` as columns.
+        """
+        periods = pd.period_range(date_from, date_until, freq=freq)
+        matrix = self.rollup(freq, ['author'], domain, None, date_from, date_until).unstack('period', fill_value=0.0)
+        return matrix.reindex(columns=periods, fill_value=0.0)
+
+    def create_series_logged_time(self, author: str, date_from: str, date_until: str, ignore_weekends: bool = False):
+        """
+        Same as `DataBuilder.create_series_logged_time`, answered from cube.
+        :param author: login of worker who logged time.
+        :param date_from: start date in period.
+        :param date_until: end date in period.
+        :param ignore_weekends: whether to ignore logged time during weekends or not.
+        :return: pd.Series with physical `author`'s worklog.
+        """
+        days = pd.date_range(date_from, date_until, freq='D')
+        if ignore_weekends:
+            days = days[days.weekday < 5]
+
+        hours = self.select(None, author, date_from, date_until).groupby('day').hour.sum()
+        series = hours.reindex(days, fill_value=0)
+        series.index = series.index.date
+        series.name = None
+
+        return series